@@ -20,7 +20,7 @@ References
     674 Handbook, 9 ed.; McGraw-Hill Education, 2018.
 
 """
-import numpy as np
+from math import log, exp, pi, sqrt
 from . import utils
 from flexsolve import njitable
 import biosteam as bst
@@ -42,10 +42,6 @@ __all__ = ('compute_purchase_cost_of_trays',
            'compute_tower_diameter',
            'compute_tower_height')
 
-@njitable(cache=True)
-def minimum_thickness_from_diameter(D):
-    return 0.03125 * D + 0.125
-
 @njitable(cache=True)
 def compute_purchase_cost_of_trays(N_T, Di, F_TT, F_TM):
     """
@@ -118,7 +114,8 @@ def compute_empty_tower_cost(W):
     The purchase cost is given by [1]_. See source code for details.
     
     """
-    return np.exp(7.2756 + 0.18255*np.log(W) + 0.02297*np.log(W)**2)
+    lnW = log(W)
+    return exp(7.2756 + 0.18255*lnW + 0.02297*lnW*lnW)
 
 @njitable(cache=True)
 def compute_plaform_ladder_cost(Di, L):
@@ -162,7 +159,7 @@ def compute_tower_weight(Di, L, tv, rho_M):
     """
     Di = Di*12
     L = L*12
-    return np.pi*(Di+tv)*(L+0.8*Di)*tv*rho_M
+    return pi*(Di+tv)*(L+0.8*Di)*tv*rho_M
 
 @njitable(cache=True)
 def compute_tower_wall_thickness(Po, Di, L, S=15000, E=None, M=29.5):
@@ -196,6 +193,7 @@ def compute_tower_wall_thickness(Po, Di, L, S=15000, E=None, M=29.5):
     
     """
     # TODO: Incorporate temperature for choosing S and M
+    Di_ft = Di
     Di = Di*12 # ft to in
     L = L*12
     
@@ -209,7 +207,8 @@ def compute_tower_wall_thickness(Po, Di, L, S=15000, E=None, M=29.5):
     if Po_gauge < 5:
         Pd = 10
     elif Po_gauge < 1000:
-        Pd = np.exp(0.60608 + 0.91615*np.log(Po)) + 0.0015655*np.log(Po)**2
+        lnPo = log(Po)
+        Pd = exp(0.60608 + 0.91615*lnPo) + 0.0015655*lnPo*lnPo
     else:
         Pd = 1.1*Po_gauge
     
@@ -226,8 +225,7 @@ def compute_tower_wall_thickness(Po, Di, L, S=15000, E=None, M=29.5):
     ts += 1/8
     
     # Minimum thickness for vessel rigidity may be larger
-    Di_ft = Di/12
-    ts_min = minimum_thickness_from_diameter(Di_ft) if Di_ft > 4 else 0.25
+    ts_min = 0.03125*Di_ft + 0.125 if Di_ft > 4 else 0.25
     if ts < ts_min:
         ts = ts_min
     
@@ -259,7 +257,7 @@ def compute_tray_base_purchase_cost(Di):
     The purchase cost is given by [1]_. See source code for details.
     
     """
-    return 412.6985 * np.exp(0.1482*Di)
+    return 412.6985 * exp(0.1482*Di)
 
 @njitable(cache=True)
 def compute_n_trays_factor(N_T):
@@ -281,7 +279,7 @@ def compute_n_trays_factor(N_T):
         F_NT = 1
     return F_NT
 
-@njitable(cache=True)
+@njitable(cache=True, fastmath=True)
 def compute_murphree_stage_efficiency(mu, alpha, L, V):
     """
     Return the sectional murphree efficiency, E_mv.
@@ -328,7 +326,7 @@ def compute_flow_parameter(L, V, rho_V, rho_L):
     The flow parameter is given by [3]_. See source code for details.
     
     """
-    return L/V*(rho_V/rho_L)**0.5
+    return L/V*sqrt(rho_V/rho_L)
 
 @njitable(cache=True)
 def compute_max_capacity_parameter(TS, F_LV):
@@ -346,7 +344,7 @@ def compute_max_capacity_parameter(TS, F_LV):
     The max capacity parameter is given by [3]_. See source code for details.
     
     """
-    return 0.0105 + 8.127e-4*TS**0.755*np.exp(-1.463*F_LV**0.842)
+    return 0.0105 + 8.127e-4*TS**0.755*exp(-1.463*F_LV**0.842)
 
 @njitable(cache=True)
 def compute_max_vapor_velocity(C_sbf, sigma, rho_L, rho_V, F_F, A_ha):
@@ -384,7 +382,7 @@ def compute_max_vapor_velocity(C_sbf, sigma, rho_L, rho_V, F_F, A_ha):
     else:
         raise ValueError("ratio of open to active area, 'A', must be between 0.06 and 1") 
     
-    return C_sbf * F_HA * F_ST * ((rho_L-rho_V)/rho_V)**0.5
+    return C_sbf * F_HA * F_ST * sqrt((rho_L-rho_V)/rho_V)
 
 @njitable(cache=True)
 def compute_downcomer_area_fraction(F_LV):
@@ -429,7 +427,7 @@ def compute_tower_diameter(V_vol, U_f, f, A_dn):
     The tower diameter is given by [3]_. See source code for details.
     
     """
-    Di = (4*V_vol/(f*U_f*np.pi*(1-A_dn)))**0.5
+    Di = sqrt(4*V_vol/(f*U_f*pi*(1-A_dn)))
     if Di < 0.914:
         # Make sure diameter is not too small
         Di = 0.914
@@ -39,6 +39,36 @@ from .heat_exchange import HXutility
 
 __all__ = ('Distillation', 'BinaryDistillation', 'ShortcutColumn')
 
+# %% Bubble and dew point utilities
+
+def bubble_point_at_P(stream, bp=None):
+    """
+    Return the bubble point of `stream` at its pressure. If the equilibrium 
+    chemicals, composition, and pressure are the same as in the given bubble
+    point values, `bp`, these are returned instead.
+    
+    """
+    bubble_point = stream.get_bubble_point()
+    IDs = bubble_point.IDs
+    z = stream.get_normalized_mol(IDs)
+    P = stream.P
+    if bp and bp.P == P and bp.IDs == IDs and (bp.z == z).all(): return bp
+    return bubble_point(z, P=P)
+
+def dew_point_at_P(stream, dp=None):
+    """
+    Return the dew point of `stream` at its pressure. If the equilibrium 
+    chemicals, composition, and pressure are the same as in the given dew
+    point values, `dp`, these are returned instead.
+    
+    """
+    dew_point = stream.get_dew_point()
+    IDs = dew_point.IDs
+    z = stream.get_normalized_mol(IDs)
+    P = stream.P
+    if dp and dp.P == P and dp.IDs == IDs and (dp.z == z).all(): return dp
+    return dew_point(z, P=P)
+
 # %% Abstract distillation column unit operation
 
 class Distillation(Unit, isabstract=True):
@@ -180,6 +210,8 @@ class Distillation(Unit, isabstract=True):
         self.P = P
         self.Rmin = Rmin
         self.LHK = LHK
+        self._y = np.empty(2)
+        self._x = np.empty(2)
         self._set_distillation_product_specifications(product_specification_format,
                                                       x_bot, y_top, Lr, Hr)
         
@@ -215,6 +247,7 @@ class Distillation(Unit, isabstract=True):
                                 outs=tmo.MultiStream(None, thermo=boiler_thermo),
                                 thermo=boiler_thermo)
         self.heat_utilities = self.condenser.heat_utilities + self.boiler.heat_utilities
+        self._vle_index_cache = {}
         self.reset_cache() # Abstract method
     
     @property
@@ -238,6 +271,22 @@ class Distillation(Unit, isabstract=True):
     def boilup(self):
         return self.boiler.outs[0]['g']    
     
+    def _reset_bubble_and_dew_points(self):
+        self._condensate_dew_point = self._boilup_bubble_point = None
+        self._vapor_dew_point = self._liquid_bubble_point = None
+        self._feed_dew_point = self._feed_bubble_point = None
+        self._boilup_data = None
+    
+    def _get_vle_index(self, stream, IDs):
+        """Return an index array of the equilibrium chemicals, `IDs`, in the
+        chemicals of `stream`."""
+        chemicals = stream.chemicals
+        key = (chemicals, IDs)
+        vle_index_cache = self._vle_index_cache
+        if key in vle_index_cache: return vle_index_cache[key]
+        vle_index_cache[key] = index = np.array(chemicals.get_index(IDs), dtype=np.intp)
+        return index
+    
     @property
     def LHK(self):
         """tuple[str, str] Light and heavy keys."""
@@ -246,39 +295,32 @@ class Distillation(Unit, isabstract=True):
     def LHK(self, LHK):
         # Set light non-key and heavy non-key indices
         self._LHK = LHK = tuple(LHK)
-        intermediate_volatile_chemicals = []
         chemicals = self.chemicals
-        LHK_chemicals = LK_chemical, HK_chemical = self.chemicals[LHK]
-        Tb_light = LK_chemical.Tb
-        Tb_heavy = HK_chemical.Tb
-        LNK = []
-        HNK = []
-        gases = []
-        solids = []
-        for chemical in chemicals:
-            ID = chemical.ID
-            Tb = chemical.Tb
-            if not Tb or chemical.locked_state in ('l', 's'):
-                solids.append(ID)
-            elif chemical.locked_state == 'g':
-                gases.append(ID)
-            elif Tb < Tb_light:
-                LNK.append(ID)
-            elif Tb > Tb_heavy:
-                HNK.append(ID)
-            elif chemical not in LHK_chemicals:
-                intermediate_volatile_chemicals.append(chemical.ID)
-        self._LNK = LNK = tuple(LNK)
-        self._HNK = HNK = tuple(HNK)
-        self._gases = gases = tuple(gases)
-        self._solids = solids = tuple(solids)
-        get_index = self.chemicals.get_index
-        self._LHK_index = get_index(LHK)
+        get_index = lambda IDs: np.array(chemicals.get_index(IDs), dtype=np.intp)
+        self._LHK_index = LHK_index = get_index(LHK)
+        LK_index, HK_index = LHK_index
+        Tb = np.array([i.Tb or np.nan for i in chemicals], float)
+        locked_states = np.array([i.locked_state or '' for i in chemicals])
+        is_solid = (np.isnan(Tb) | (Tb == 0.)
+                    | (locked_states == 'l') | (locked_states == 's'))
+        is_gas = ~is_solid & (locked_states == 'g')
+        is_volatile = ~(is_solid | is_gas)
+        is_LNK = is_volatile & (Tb < Tb[LK_index])
+        is_HNK = is_volatile & ~is_LNK & (Tb > Tb[HK_index])
+        is_intermediate = is_volatile & ~(is_LNK | is_HNK)
+        is_intermediate[LHK_index] = False
+        IDs = chemicals.IDs
+        get_IDs = lambda mask: tuple([IDs[i] for i in np.flatnonzero(mask)])
+        self._LNK = LNK = get_IDs(is_LNK)
+        self._HNK = HNK = get_IDs(is_HNK)
+        self._gases = gases = get_IDs(is_gas)
+        self._solids = solids = get_IDs(is_solid)
+        self._intermediate_volatile_chemicals = intermediates = get_IDs(is_intermediate)
         self._LNK_index = get_index(LNK)
         self._HNK_index = get_index(HNK)
         self._gases_index = get_index(gases)
         self._solids_index = get_index(solids)
-        self._intermediate_volatile_chemicals = tuple(intermediate_volatile_chemicals)
+        self._intermediate_volatile_chemicals_index = get_index(intermediates)
     
     @property
     def Rmin(self):
@@ -299,7 +341,9 @@ class Distillation(Unit, isabstract=True):
             "to set distillate composition")
         assert 0 < y_top < 1, "light key composition in the distillate must be a fraction" 
         self._y_top = y_top
-        self._y = np.array([y_top, 1-y_top])
+        y = self._y
+        y[0] = y_top
+        y[1] = 1. - y_top
     
     @property
     def x_bot(self):
@@ -312,7 +356,9 @@ class Distillation(Unit, isabstract=True):
             "product composition")
         assert 0 < x_bot < 1, "heavy key composition in the bottoms product must be a fraction" 
         self._x_bot = x_bot
-        self._x = np.array([x_bot, 1-x_bot])
+        x = self._x
+        x[0] = x_bot
+        x[1] = 1. - x_bot
     
     @property
     def Lr(self):
@@ -463,9 +509,11 @@ class Distillation(Unit, isabstract=True):
             x_bot = self.x_bot
         else:
             distillate, bottoms_product = self.outs
-            LHK = self._LHK
-            y_top, _ = distillate.get_normalized_mol(LHK)
-            x_bot, _ = bottoms_product.get_normalized_mol(LHK)
+            LHK_index = self._LHK_index
+            LK, HK = distillate.mol[LHK_index]
+            y_top = LK / (LK + HK)
+            LK, HK = bottoms_product.mol[LHK_index]
+            x_bot = LK / (LK + HK)
         return y_top, x_bot
     
     def _check_mass_balance(self):
@@ -481,7 +529,7 @@ class Distillation(Unit, isabstract=True):
                 raise InfeasibleRegion("heavy key composition")
         if tmo.settings.debug:
             intermediate_chemicals = self._intermediate_volatile_chemicals
-            intemediates_index = self.chemicals.get_index(intermediate_chemicals)
+            intemediates_index = self._intermediate_volatile_chemicals_index
             intermediate_flows = self.mol_in[intemediates_index]
             minflow = min(LK_distillate, HK_bottoms)
             for flow, chemical in zip(intermediate_flows, intermediate_chemicals):
@@ -500,8 +548,7 @@ class Distillation(Unit, isabstract=True):
         HNK_index = self._HNK_index
         gases_index = self._gases_index
         solids_index = self._solids_index
-        intermediate_chemicals = self._intermediate_volatile_chemicals
-        intemediates_index = self.chemicals.get_index(intermediate_chemicals)
+        intemediates_index = self._intermediate_volatile_chemicals_index
         LHK_mol = mol[LHK_index]
         LNK_mol = mol[LNK_index]
         HNK_mol = mol[HNK_index]
@@ -541,8 +588,10 @@ class Distillation(Unit, isabstract=True):
         reboiler_bottoms_product = self.boiler.outs[0]['l']
         condenser_distillate.copy_like(distillate)
         reboiler_bottoms_product.copy_like(bottoms_product)
-        self._condensate_dew_point = dp = condenser_distillate.dew_point_at_P()
-        self._boilup_bubble_point = bp = reboiler_bottoms_product.bubble_point_at_P()
+        self._condensate_dew_point = dp = dew_point_at_P(condenser_distillate,
+                                                         self._condensate_dew_point)
+        self._boilup_bubble_point = bp = bubble_point_at_P(reboiler_bottoms_product,
+                                                           self._boilup_bubble_point)
         bottoms_product.T = bp.T
         distillate.T = dp.T
     
@@ -556,12 +605,12 @@ class Distillation(Unit, isabstract=True):
         feed = self.feed
         data = feed.get_data()
         H_feed = feed.H
-        try: dp = feed.dew_point_at_P()
+        try: self._feed_dew_point = dp = dew_point_at_P(feed, self._feed_dew_point)
         except: pass
         else: feed.T = dp.T
         feed.phase = 'g'
         H_vap = feed.H
-        try: bp = feed.bubble_point_at_P()
+        try: self._feed_bubble_point = bp = bubble_point_at_P(feed, self._feed_bubble_point)
         except: pass
         else: feed.T = bp.T
         feed.phase = 'l'
@@ -585,30 +634,34 @@ class Distillation(Unit, isabstract=True):
         condensate_x_mol = dp.x
         condensate = self.condensate
         condensate.empty()
-        condensate.imol[dp.IDs] = condensate_x_mol * F_mol_condensate
+        condensate.mol[self._get_vle_index(condensate, dp.IDs)] = condensate_x_mol * F_mol_condensate
         condensate.T = dp.T
         condensate.P = dp.P
         vap = condenser.ins[0]
         vap.mol = distillate.mol + condensate.mol
-        vap_T = vap.dew_point_at_P().T
+        self._vapor_dew_point = vap_dp = dew_point_at_P(vap, self._vapor_dew_point)
+        vap_T = vap_dp.T
         if vap_T < dp.T: vap_T = dp.T + 0.1
         vap.T = vap_T
         vap.P = distillate.P
         
         # Set boiler conditions
         boiler.outs[0].imol['l'] = bottoms_product.mol
-        F_vap_feed = feed.imol['g'].sum()
+        self._F_vap_feed = F_vap_feed = feed.imol['g'].sum()
         self._F_mol_boilup = F_mol_boilup = (R+1)*F_mol_distillate - F_vap_feed
         bp = self._boilup_bubble_point
-        boilup_flow = bp.y * F_mol_boilup
         boilup = self.boilup
-        boilup.T = bp.T
-        boilup.P = bp.P
-        boilup.imol[bp.IDs] = boilup_flow
+        boilup_data = (bp, F_mol_boilup)
+        if self._boilup_data != boilup_data:
+            boilup.T = bp.T
+            boilup.P = bp.P
+            boilup.mol[self._get_vle_index(boilup, bp.IDs)] = bp.y * F_mol_boilup
+            self._boilup_data = boilup_data
         liq = boiler.ins[0]
         liq.phase = 'l'
         liq.mol = bottoms_product.mol + boilup.mol
-        liq_T = liq.bubble_point_at_P().T
+        self._liquid_bubble_point = liq_bp = bubble_point_at_P(liq, self._liquid_bubble_point)
+        liq_T = liq_bp.T
         if liq_T > bp.T: liq_T = bp.T - 0.1
         liq.T = liq_T
     
@@ -619,10 +672,10 @@ class Distillation(Unit, isabstract=True):
         H_out = self.H_out
         H_in = self.H_in
         Q_overall_boiler =  H_out - H_in - Q_condenser
-        Q_boiler = boiler.outs[0].H - boiler.ins[0].H
+        H_out_boiler = boiler.outs[0].H
+        Q_boiler = H_out_boiler - boiler.ins[0].H
         if Q_boiler < Q_overall_boiler:
             liquid = boiler.ins[0]
-            H_out_boiler = boiler.outs[0].H
             liquid.H = H_out_boiler - Q_overall_boiler
             boiler._design(Q_overall_boiler)
             condenser._design(Q_condenser)
@@ -634,7 +687,6 @@ class Distillation(Unit, isabstract=True):
     
     def _compute_N_stages(self):
         """Return a tuple with the actual number of stages for the rectifier and the stripper."""
-        feed = self.feed
         vap, liq = self.outs
         Design = self.design_results
         R = Design['Reflux']
@@ -658,7 +710,7 @@ class Distillation(Unit, isabstract=True):
             # Calculate Murphree Efficiency for stripping section
             mu = liq.get_property('mu', 'mPa*s')
             V_Smol = self._F_mol_boilup
-            L_Smol = R*F_mol_distillate + feed.imol['g'].sum()
+            L_Smol = R*F_mol_distillate + self._F_vap_feed
             E_stripper = design.compute_murphree_stage_efficiency(mu,
                                                            alpha_LHK_bottoms,
                                                            L_Smol, V_Smol)
@@ -669,6 +721,21 @@ class Distillation(Unit, isabstract=True):
         N_stripper = np.ceil((N_stages-mid_stage)/E_stripper)
         return N_rectifier, N_stripper
         
+    def _compute_section_diameter(self, L, V, V_vol, rho_L, rho_V, sigma,
+                                  TS, F_F, A_ha, f):
+        """Return the diameter [ft] of a column section given the liquid and
+        vapor mass flow rates, the vapor volumetric flow rate [m^3/s], the 
+        liquid and vapor densities [kg/m^3], the surface tension [dyn/cm], 
+        and the tray spacing, foaming factor, open tray area fraction, and
+        velocity fraction."""
+        F_LV = design.compute_flow_parameter(L, V, rho_V, rho_L)
+        C_sbf = design.compute_max_capacity_parameter(TS, F_LV)
+        U_f = design.compute_max_vapor_velocity(C_sbf, sigma, rho_L, rho_V, F_F, A_ha)
+        A_dn = self._A_dn
+        if A_dn is None:
+            self._A_dn = A_dn = design.compute_downcomer_area_fraction(F_LV)
+        return design.compute_tower_diameter(V_vol, U_f, f, A_dn) * 3.28
+    
     def _complete_distillation_column_design(self):
         distillate, bottoms_product = self.outs
         Design = self.design_results
@@ -676,6 +743,9 @@ class Distillation(Unit, isabstract=True):
         Rstages, Sstages = self._compute_N_stages()
         is_divided = self.is_divided
         TS = self._TS
+        F_F = self._F_F
+        A_ha = self._A_ha
+        f = self._f
         
         ### Get diameter of rectifying section based on top plate ###
         
@@ -687,16 +757,8 @@ class Distillation(Unit, isabstract=True):
         vap = self.condenser.ins[0]
         V_vol = vap.get_total_flow('m^3/s')
         rho_V = distillate.rho
-        F_LV = design.compute_flow_parameter(L, V, rho_V, rho_L)
-        C_sbf = design.compute_max_capacity_parameter(TS, F_LV)
-        F_F = self._F_F
-        A_ha = self._A_ha
-        U_f = design.compute_max_vapor_velocity(C_sbf, sigma, rho_L, rho_V, F_F, A_ha)
-        A_dn = self._A_dn
-        if A_dn is None:
-           self._A_dn = A_dn = design.compute_downcomer_area_fraction(F_LV)
-        f = self._f
-        R_diameter = design.compute_tower_diameter(V_vol, U_f, f, A_dn) * 3.28
+        R_diameter = self._compute_section_diameter(L, V, V_vol, rho_L, rho_V, sigma,
+                                                    TS, F_F, A_ha, f)
         
         ### Get diameter of stripping section based on feed plate ###
         rho_L = bottoms_product.rho
@@ -705,14 +767,8 @@ class Distillation(Unit, isabstract=True):
         V_vol = boilup.get_total_flow('m^3/s')
         rho_V = boilup.rho
         L = bottoms_product.F_mass # To get liquid going down
-        F_LV = design.compute_flow_parameter(L, V, rho_V, rho_L)
-        C_sbf = design.compute_max_capacity_parameter(TS, F_LV)
-        sigma = condensate.get_property('sigma', 'dyn/cm')
-        U_f = design.compute_max_vapor_velocity(C_sbf, sigma, rho_L, rho_V, F_F, A_ha)
-        A_dn = self._A_dn
-        if A_dn is None:
-            A_dn = design.compute_downcomer_area_fraction(F_LV)
-        S_diameter = design.compute_tower_diameter(V_vol, U_f, f, A_dn) * 3.28
+        S_diameter = self._compute_section_diameter(L, V, V_vol, rho_L, rho_V, sigma,
+                                                    TS, F_F, A_ha, f)
         Po = self.P * 0.000145078 # to psi
         rho_M = material_densities_lb_per_in3[self.vessel_material]
         if Po < 14.68:
@@ -796,55 +852,165 @@ class Distillation(Unit, isabstract=True):
 
 # %% McCabe-Thiele distillation model utilities
 
-def compute_stages_McCabeThiele(P, operating_line,
-                                x_stages, y_stages, T_stages,
+# Maximum number of stages computed for each section of the column
+_max_stages_per_section = 101
+
+def compute_stages_McCabeThiele(P, m, b,
+                                x_stages, y_stages, T_stages, N_stages,
                                 x_limit, solve_Ty):
     """
     Use the McCabe-Thiele method to find the specifications at every stage of
     the operating line before the maximum liquid molar fraction, `x_limit`. 
-    Append the light key liquid molar fraction, light key vapor molar
+    Write the light key liquid molar fraction, light key vapor molar
     fraction, and stage temperatures to `x_stages`, `y_stages` and `T_stages`
-    respectively.
+    respectively, after the first `N_stages` stages. Return the new number 
+    of stages.
     
     Parameters
     ----------
     P : float
         Pressure [Pa].
-    operating_line : function
-                     Should return the liquid molar fraction of the light
-                     key given its vapor molar fraction.
-    x_stages : list
-               Liquid molar compositions at each stage. Last element
-               should be the starting point for the next stage.
-    y_stages : list
-               Vapor molar compositions at each stage. Last element 
-               should be the starting point for the next stage.
+    m : float
+        Slope of the operating line.
+    b : float
+        Intercept of the operating line.
+    x_stages : 1d array
+               Liquid molar compositions at each stage. Element at 
+               `N_stages - 1` should be the starting point for the next stage.
+    y_stages : 1d array
+               Vapor molar compositions at each stage. Element at 
+               `N_stages - 1` should be the starting point for the next stage.
+    T_stages : 1d array
+               Bubble point temperature at the liquid molar composition of
+               each stage.
+    N_stages : int
+               Number of stages already in `x_stages` and `y_stages`.
     x_limit : float
               Maximum value of liquid composition before algorithm stops.
-    T_stages : list
-               Temperature at each stage.
     solve_Ty : function
                Should return T and y given x.
         
     """
-    i = 0
-    yi = y_stages[-1]
-    xi = x_stages[-1]
+    x = np.empty(2)
+    i = N_stages
+    N_max = N_stages + _max_stages_per_section
+    xi = x_stages[i - 1]
     while xi < x_limit:
-        if i > 100:
-            raise RuntimeError('cannot meet specifications! stages > 100')
-        i += 1
+        if i == N_max:
+            raise RuntimeError('cannot meet specifications! '
+                               f'stages > {_max_stages_per_section - 1}')
         # Go Up
-        x = np.array((xi, 1-xi))
-        T, y = solve_Ty(x, P)
-        yi = y[0]
-        y_stages.append(yi)
-        T_stages.append(T)
+        x[0] = xi
+        x[1] = 1. - xi
+        T_stages[i - 1], y = solve_Ty(x, P)
+        y_stages[i] = yi = y[0]
         # Go Right
-        xi = operating_line(yi)
+        xi = (yi - b)/m
         if xi > x_limit:
             xi = x_limit
-        x_stages.append(xi)
+        x_stages[i] = xi
+        i += 1
+    return i
+
+def compute_relative_volatilities_McCabeThiele(x_stages, y_stages):
+    """
+    Return the relative volatilities of the light key to the heavy key at the
+    top and at the bottom of the column given the light key liquid and vapor
+    molar fractions at each stage.
+    
+    """
+    x = x_stages[-1]
+    y = y_stages[-1]
+    alpha_LHK_distillate = (y/x) / ((1-y)/(1-x))
+    x = x_stages[0]
+    y = y_stages[0]
+    alpha_LHK_bottoms = (y/x) / ((1-y)/(1-x))
+    return alpha_LHK_distillate, alpha_LHK_bottoms
+
+def compute_x_Rmin(P, q, zf, solve_Ty, xtol=1e-9):
+    """
+    Return the light key liquid molar fraction at the intersection of the 
+    q-line and the equilibrium curve (i.e. at minimum reflux). The root is 
+    bracketed by [0, 1], where the residuals are known without solving for 
+    the bubble point, so that the same intersection is found as when 
+    solving for the bubble point at the bounds (which matters when the 
+    q-line crosses the equilibrium curve more than once).
+    
+    Parameters
+    ----------
+    P : float
+        Pressure [Pa].
+    q : float
+        Feed quality.
+    zf : float
+        Light key molar fraction of the feed.
+    solve_Ty : function
+               Should return T and y given x.
+    xtol : float, optional
+        Absolute tolerance of the light key liquid molar fraction.
+    
+    """
+    # q-line: y = a*x + c
+    a = q/(q-1)
+    c = -zf/(q-1)
+    z = np.empty(2)
+    def Rmin_intersection(x):
+        if x == 0.: return c
+        elif x == 1.: return a + c - 1.
+        z[0] = x
+        z[1] = 1. - x
+        return a*x + c - solve_Ty(z, P)[1][0]
+    return brentq(Rmin_intersection, 0., 1., xtol=xtol)
+
+def memoize_solve_Ty(solve_Ty, cache):
+    """
+    Return a function that wraps `solve_Ty` and memoizes its results 
+    in `cache` by the light key liquid molar fraction and the pressure.
+    The composition passed to the returned function must be binary.
+    
+    Parameters
+    ----------
+    solve_Ty : function
+               Should return T and y given x.
+    cache : dict
+            Results of previous calls to `solve_Ty`.
+    
+    """
+    def solve_Ty_memoized(x, P):
+        key = (x[0], P)
+        if key in cache:
+            return cache[key]
+        else:
+            if len(cache) > 500: cache.clear()
+            cache[key] = Ty = solve_Ty(x, P)
+            return Ty
+    return solve_Ty_memoized
+
+def compute_equilibrium_curve(P, x, solve_Ty):
+    """
+    Return the light key vapor molar fractions and the bubble point 
+    temperatures in equilibrium with the light key liquid molar fractions, 
+    `x`, of a binary mixture.
+    
+    Parameters
+    ----------
+    P : float
+        Pressure [Pa].
+    x : 1d array
+        Light key liquid molar fractions.
+    solve_Ty : function
+               Should return T and y given x.
+    
+    """
+    N = x.size
+    z = np.empty((N, 2))
+    z[:, 0] = x
+    z[:, 1] = 1. - x
+    y = np.empty(N)
+    T = np.empty(N)
+    for i in range(N):
+        T[i], (y[i], _) = solve_Ty(z[i], P)
+    return y, T
     
 
 # %% McCabe-Thiele distillation column unit operation
@@ -1072,25 +1238,31 @@ class BinaryDistillation(Distillation, new_graphics=False):
         self._update_distillate_and_bottoms_temperature()
 
     def reset_cache(self):
+        self._reset_bubble_and_dew_points()
+        self._bubble_point_caches = {}
         if not hasattr(self, '_McCabeThiele_args'):
             self._McCabeThiele_args = np.zeros(6)
         else:
             self._McCabeThiele_args = np.zeros(6)
             for i in self.auxiliary_units: i.reset_cache()
 
-    def _run_McCabeThiele(self):
-        distillate, bottoms = self.outs
-        chemicals = self.chemicals
+    def _get_solve_Ty(self):
+        """Return a function that solves the bubble point temperature and 
+        vapor composition given the liquid composition of the light and heavy
+        keys. Results are memoized by composition and pressure."""
         LHK = self._LHK
-        LHK_index = chemicals.get_index(LHK)
+        caches = self._bubble_point_caches
+        if LHK in caches:
+            cache = caches[LHK]
+        else:
+            caches[LHK] = cache = {}
+        solve_Ty = self.outs[1].get_bubble_point(LHK).solve_Ty
+        return memoize_solve_Ty(solve_Ty, cache)
 
+    def _run_McCabeThiele(self):
         # Feed light key mol fraction
-        feed = self.feed
-        liq_mol = feed.imol['l']
-        vap_mol = feed.imol['g']
-        LHK_mol = liq_mol[LHK_index] + vap_mol[LHK_index]
-        F_mol_LHK = LHK_mol.sum()
-        zf = LHK_mol[0]/F_mol_LHK
+        LK_mol, HK_mol = self.feed.mol[self._LHK_index]
+        zf = LK_mol/(LK_mol + HK_mol)
         q = self.get_feed_quality()
         
         # Main arguments
@@ -1107,13 +1279,11 @@ class BinaryDistillation(Distillation, new_graphics=False):
         # Get R_min and the q_line 
         if abs(q - 1) < 1e-4:
             q = 1 - 1e-4
-        q_line = lambda x: q*x/(q-1) - zf/(q-1)
-        self._q_line_args = dict(q=q, zf=zf)
+        self._q_line_coefficients = a_q, b_q = q/(q-1), -zf/(q-1)
         
-        solve_Ty = bottoms.get_bubble_point(LHK).solve_Ty
-        Rmin_intersection = lambda x: q_line(x) - solve_Ty(np.array((x, 1-x)), P)[1][0]
-        x_Rmin = brentq(Rmin_intersection, 0, 1)
-        y_Rmin = q_line(x_Rmin)
+        solve_Ty = self._get_solve_Ty()
+        x_Rmin = compute_x_Rmin(P, q, zf, solve_Ty)
+        y_Rmin = a_q*x_Rmin + b_q
         m = (y_Rmin-y_top)/(x_Rmin-y_top)
         Rmin = m/(1-m)
         if Rmin < self._Rmin:
@@ -1123,33 +1293,38 @@ class BinaryDistillation(Distillation, new_graphics=False):
         # Rectifying section: Inntersects q_line with slope given by R/(R+1)
         m1 = R/(R+1)
         b1 = y_top-m1*y_top
-        rs = lambda y: (y - b1)/m1 # -> x
         
-        # y_m is the solution to lambda y: y - q_line(rs(y))
+        # y_m is the solution to y = q_line((y - b1)/m1)
         self._y_m = y_m = (q*b1 + m1*zf)/(q - m1*(q-1))
-        self._x_m = x_m = rs(y_m)
+        self._x_m = x_m = (y_m - b1)/m1
         
         # Stripping section: Intersects Rectifying section and q_line and beggins at bottoms liquid composition
         m2 = (x_bot-y_m)/(x_bot-x_m)
         b2 = y_m-m2*x_m
-        ss = lambda y: (y-b2)/m2 # -> x        
+        self._operating_line_args = dict(m1=m1, b1=b1, m2=m2, b2=b2)
         
         # Data for staircase
-        self._x_stages = x_stages = [x_bot]
-        self._y_stages = y_stages = [x_bot]
-        self._T_stages = T_stages = []
-        compute_stages_McCabeThiele(P, ss, x_stages, y_stages, T_stages, x_m, solve_Ty)
-        yi = y_stages[-1]
-        xi = rs(yi)
-        x_stages[-1] = xi if xi < 1 else 0.99999
-        compute_stages_McCabeThiele(P, rs, x_stages, y_stages, T_stages, y_top, solve_Ty)
+        N_max = 2 * _max_stages_per_section + 1
+        x_stages = np.empty(N_max)
+        y_stages = np.empty(N_max)
+        T_stages = np.empty(N_max)
+        x_stages[0] = y_stages[0] = x_bot
+        N_stages = compute_stages_McCabeThiele(P, m2, b2, x_stages, y_stages, T_stages, 1, x_m, solve_Ty)
+        yi = y_stages[N_stages - 1]
+        xi = (yi - b1)/m1
+        x_stages[N_stages - 1] = xi if xi < 1 else 0.99999
+        N_stages = compute_stages_McCabeThiele(P, m1, b1, x_stages, y_stages, T_stages, N_stages, y_top, solve_Ty)
+        self._x_stages = x_stages = x_stages[:N_stages]
+        self._y_stages = y_stages = y_stages[:N_stages]
+        self._T_stages = T_stages[:N_stages - 1]
+        self._relative_volatilities_LHK = compute_relative_volatilities_McCabeThiele(
+            x_stages, y_stages
+        )
         
         # Find feed stage
-        N_stages = len(x_stages)
-        feed_stage = ceil(N_stages/2)
-        for i in range(len(y_stages)-1):
-            if y_stages[i] < y_m < y_stages[i+1]:
-                feed_stage = i+1
+        feed_stage = int(np.searchsorted(y_stages, y_m))
+        if not 0 < feed_stage < N_stages or y_stages[feed_stage] == y_m:
+            feed_stage = ceil(N_stages/2)
         
         # Results
         Design = self.design_results
@@ -1159,18 +1334,7 @@ class BinaryDistillation(Distillation, new_graphics=False):
         Design['Reflux'] = R
         
     def _get_relative_volatilities_LHK(self):
-        x_stages = self._x_stages
-        y_stages = self._y_stages
-        
-        K_light = y_stages[-1]/x_stages[-1] 
-        K_heavy = (1-y_stages[-1])/(1-x_stages[-1])
-        alpha_LHK_distillate = K_light/K_heavy
-        
-        K_light = y_stages[0]/x_stages[0] 
-        K_heavy = (1-y_stages[0])/(1-x_stages[0] )
-        alpha_LHK_bottoms = K_light/K_heavy
-        
-        return alpha_LHK_distillate, alpha_LHK_bottoms
+        return self._relative_volatilities_LHK
         
     def _design(self):
         self._run_McCabeThiele()
@@ -1179,27 +1343,17 @@ class BinaryDistillation(Distillation, new_graphics=False):
        
     def _plot_stages(self):
         """Plot stages, graphical aid line, and equilibrium curve. The plot does not include operating lines nor a legend."""
-        vap, liq = self.outs
         if not hasattr(self, '_x_stages'):
             raise RuntimeError('cannot plot stages without running McCabe Thiele binary distillation')
         x_stages = self._x_stages
         y_stages = self._y_stages
-        LHK = self.LHK
         LK = self.LHK[0]
         P = self.P
         
         # Equilibrium data
         x_eq = np.linspace(0, 1, 100)
-        y_eq = np.zeros(100)
-        T = np.zeros(100)
-        n = 0
-        
-        bp = vap.get_bubble_point(IDs=LHK)
-        solve_Ty = bp.solve_Ty
-        for xi in x_eq:
-            T[n], y = solve_Ty(np.array([xi, 1-xi]), P)
-            y_eq[n] = y[0]
-            n += 1
+        solve_Ty = self._get_solve_Ty()
+        y_eq, _ = compute_equilibrium_curve(P, x_eq, solve_Ty)
             
         # Set-up graph
         plt.figure()
@@ -1210,17 +1364,10 @@ class BinaryDistillation(Distillation, new_graphics=False):
         plt.xlim([0, 1])
         
         # Plot stages
-        x_stairs = []
-        for x in x_stages:
-            x_stairs.append(x)
-            x_stairs.append(x)
-            
-        y_stairs = []
-        for y in y_stages:
-            y_stairs.append(y)
-            y_stairs.append(y)
-        x_stairs.pop(-1)
-        x_stairs.insert(0, y_stairs[0])
+        y_stairs = np.repeat(y_stages, 2)
+        x_stairs = np.empty_like(y_stairs)
+        x_stairs[0] = y_stairs[0]
+        x_stairs[1:] = np.repeat(x_stages, 2)[:-1]
         plt.plot(x_stairs, y_stairs, '--')
         
         # Graphical aid line
@@ -1233,23 +1380,17 @@ class BinaryDistillation(Distillation, new_graphics=False):
         """Plot the McCabe Thiele Diagram."""
         # Plot stages, graphical aid and equilibrium curve
         self._plot_stages()
-        vap, liq = self.outs
         Design = self.design_results
-        if not hasattr(self, '_x_stages'): self._design()
-        q_args = self._q_line_args
-        zf = q_args['zf']
-        q = q_args['q']
-        q_line = lambda x: q*x/(q-1) - zf/(q-1)
-        y_top, x_bot = self._get_y_top_and_x_bot()
+        
+        # The q-line intersects the graphical aid at the feed composition
+        a_q, b_q = self._q_line_coefficients
+        x_m2 = b_q/(1 - a_q)
+        y_top, x_bot = self._McCabeThiele_args[2:4]
         stages = Design['Theoretical stages']
         Rmin = Design['Minimum reflux']
         R = Design['Reflux']
         feed_stage = Design['Theoretical feed stage']
         
-        # q_line
-        intersect2 = lambda x: x - q_line(x)
-        x_m2 = brentq(intersect2, 0, 1)
-        
         # Graph q-line, Rectifying and Stripping section
         plt.plot([self._x_m, x_m2], [self._y_m, x_m2])
         plt.plot([self._x_m, y_top], [self._y_m, y_top])
@@ -1492,13 +1633,13 @@ class ShortcutColumn(Distillation, new_graphics=False):
         if reset_cache:
             self._dew_point = DewPoint(vle_chemicals, self.thermo)
             self._bubble_point = BubblePoint(vle_chemicals, self.thermo)
-            self._IDs_vle = self._dew_point.IDs
+            self._IDs_vle = IDs = self._dew_point.IDs
             self._vle_chemicals = vle_chemicals
+            self._vle_index = {j: i for i, j in enumerate(self.chemicals.get_index(IDs))}
             
         # Setup light and heavy keys
-        LHK = [i.ID for i in self.chemicals[self.LHK]]
-        IDs = self._IDs_vle
-        self._LHK_vle_index = np.array([IDs.index(i) for i in LHK], dtype=int)
+        vle_index = self._vle_index
+        self._LHK_vle_index = np.array([vle_index[i] for i in self._LHK_index], dtype=int)
         
         # Add temporary specification
         composition_spec = self.product_specification_format == 'Composition'
@@ -1529,6 +1670,7 @@ class ShortcutColumn(Distillation, new_graphics=False):
         if composition_spec: self._Lr = self._Hr = None
         
     def reset_cache(self):
+        self._reset_bubble_and_dew_points()
         self._vle_chemicals = None
 
     def plot_stages(self):
@@ -1577,13 +1719,16 @@ class ShortcutColumn(Distillation, new_graphics=False):
         
     def _get_relative_volatilities_LHK(self):
         distillate, bottoms = self.outs
-        LHK = self.LHK
+        LHK = self._LHK
+        LHK_index = self._LHK_index
         condensate = self.condensate
-        K_light, K_heavy = distillate.get_molar_composition(LHK) / condensate.get_molar_composition(LHK)
+        K_light, K_heavy = (distillate.mol[LHK_index] / distillate.F_mol
+                            / condensate.get_molar_composition(LHK))
         alpha_LHK_distillate = K_light/K_heavy
         
         boilup = self.boilup
-        K_light, K_heavy = boilup.get_molar_composition(LHK) / bottoms.get_molar_composition(LHK)
+        K_light, K_heavy = (boilup.get_molar_composition(LHK)
+                            / (bottoms.mol[LHK_index] / bottoms.F_mol))
         alpha_LHK_distillate = K_light/K_heavy
         alpha_LHK_bottoms = K_light/K_heavy
         
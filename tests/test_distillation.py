@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+"""
+import pytest
+import numpy as np
+import biosteam as bst
+import thermosteam as tmo
+from biosteam.units.distillation import compute_x_Rmin
+from scipy.optimize import brentq
+from numpy.testing import assert_allclose
+
+def create_distillation_column(cls, feed):
+    return cls(None, ins=feed, outs=(None, None),
+               LHK=('Methanol', 'Water'),
+               y_top=0.99, x_bot=0.01, k=2,
+               is_divided=True)
+
+@pytest.mark.parametrize('cls', [bst.units.BinaryDistillation,
+                                 bst.units.ShortcutColumn])
+def test_distillation_reset_cache(cls):
+    bst.settings.set_thermo(['Water', 'Methanol', 'Glycerol'], cache=False)
+    feed = bst.Stream(None, flow=(80, 100, 25))
+    feed.T = feed.bubble_point_at_P().T
+    D1 = create_distillation_column(cls, feed)
+    D1.simulate()
+
+    # Results must reflect the new model after resetting the cache
+    Psat = D1.chemicals.Methanol.Psat
+    f = Psat.copy()
+    Psat.add_model(lambda T: 1.3 * f(T), top_priority=True)
+    D1.reset_cache()
+    D1.simulate()
+    D2 = create_distillation_column(cls, feed.copy())
+    D2.simulate()
+    assert_allclose([i.T for i in D1.outs], [i.T for i in D2.outs])
+    assert_allclose(D1.boilup.T, D2.boilup.T)
+    assert_allclose(D1.boilup.mol, D2.boilup.mol, rtol=1e-6)
+    for key, value in D2.design_results.items():
+        assert_allclose(D1.design_results[key], value, rtol=1e-6)
+
+@pytest.mark.parametrize('cls', [bst.units.BinaryDistillation,
+                                 bst.units.ShortcutColumn])
+def test_distillation_auxiliary_thermo_chemical_order(cls):
+    bst.settings.set_thermo(['Water', 'Methanol', 'Glycerol'], cache=True)
+    chemicals = bst.settings.get_chemicals()
+    thermo = tmo.Thermo(tmo.Chemicals([chemicals.Glycerol,
+                                       chemicals.Methanol,
+                                       chemicals.Water]))
+    feed = bst.Stream(None, flow=(80, 100, 25))
+    feed.T = feed.bubble_point_at_P().T
+    D1 = create_distillation_column(cls, feed)
+    D1.simulate()
+
+    # Condensate and boilup must be indexed by their own chemicals
+    D2 = cls(None, ins=feed.copy(), outs=(None, None),
+             LHK=('Methanol', 'Water'),
+             y_top=0.99, x_bot=0.01, k=2, is_divided=True,
+             condenser_thermo=thermo, boiler_thermo=thermo)
+    D2.simulate()
+    IDs = ('Water', 'Methanol', 'Glycerol')
+    assert_allclose(D1.condensate.imol[IDs], D2.condensate.imol[IDs], rtol=1e-6)
+    assert_allclose(D1.boilup.imol[IDs], D2.boilup.imol[IDs], rtol=1e-6)
+    assert_allclose(D1.design_results['Theoretical stages'],
+                    D2.design_results['Theoretical stages'])
+
+def get_q_line_residual(P, q, zf, solve_Ty):
+    a = q/(q-1)
+    b = -zf/(q-1)
+    return lambda x: a*x + b - solve_Ty(np.array([x, 1-x]), P)[1][0]
+
+def test_compute_x_Rmin():
+    bst.settings.set_thermo(['Methanol', 'Water'], cache=True)
+    chemicals = bst.settings.get_chemicals()
+    solve_Ty = tmo.equilibrium.BubblePoint(chemicals).solve_Ty
+    for P in (101325, 5e5):
+        for zf in (0.2, 0.5, 0.8):
+            for q in (-1, 0.3, 0.7, 1 - 1e-4, 1.5):
+                f = get_q_line_residual(P, q, zf, solve_Ty)
+                x_Rmin = compute_x_Rmin(P, q, zf, solve_Ty)
+                assert_allclose(x_Rmin, brentq(f, 0, 1), atol=1e-5)
+    
+    # The q-line crosses the equilibrium curve three times (at x = 0.203, 
+    # 0.418, and 0.676); the intersection found by bracketing [0, 1] is kept
+    bst.settings.set_thermo(['Acetone', 'Water'], cache=True)
+    chemicals = bst.settings.get_chemicals()
+    solve_Ty = tmo.equilibrium.BubblePoint(chemicals).solve_Ty
+    P = 5e5; q = -0.352; zf = 0.8194
+    f = get_q_line_residual(P, q, zf, solve_Ty)
+    x_Rmin = compute_x_Rmin(P, q, zf, solve_Ty)
+    assert_allclose(x_Rmin, 0.2027, atol=1e-4)
+    assert_allclose(x_Rmin, brentq(f, 0, 1), atol=1e-5)
+    compute_x_Rmin(P, q, 0.1, solve_Ty)
+    assert compute_x_Rmin(P, q, zf, solve_Ty) == x_Rmin
+
+def test_binary_distillation_minimum_reflux_near_azeotrope():
+    bst.settings.set_thermo(['Water', 'Ethanol'], cache=True)
+    feed = bst.Stream(None, Water=80, Ethanol=20)
+    feed.vle(V=0.7, P=101325)
+    D1 = bst.units.BinaryDistillation(None, ins=feed, LHK=('Ethanol', 'Water'),
+                                      y_top=0.6, x_bot=0.01, k=2)
+    D1.simulate()
+    assert_allclose(D1.design_results['Minimum reflux'], 1.39325, rtol=1e-4)
+
+def test_binary_distillation_minimum_reflux_multiple_intersections():
+    # The q-line of this superheated feed crosses the equilibrium curve three 
+    # times
+    bst.settings.set_thermo(['Water', 'Acetone'], cache=True)
+    feed = bst.Stream(None, Water=18.06, Acetone=81.94, T=503, P=5e5, phase='g')
+    D1 = bst.units.BinaryDistillation(None, ins=feed, LHK=('Acetone', 'Water'),
+                                      y_top=0.85, x_bot=0.01, k=3, P=5e5)
+    D1.simulate()
+    assert_allclose(D1.design_results['Minimum reflux'], 0.41914, rtol=1e-4)
+    assert D1.design_results['Theoretical stages'] == 9
+
+def test_distillation_custom_tray_material():
+    from biosteam.units.design_tools.specification_factors import (
+        tray_material_factor_functions
+    )
+    bst.settings.set_thermo(['Water', 'Methanol', 'Glycerol'], cache=True)
+    feed = bst.Stream(None, flow=(80, 100, 25))
+    feed.T = feed.bubble_point_at_P().T
+    tray_material_factor_functions['Dummy'] = lambda Di: 2.
+    try:
+        D1 = create_distillation_column(bst.units.BinaryDistillation, feed)
+        D1.tray_material = 'Dummy'
+        D1.simulate()
+        cost = D1.purchase_costs['Rectifier trays']
+        D1.tray_material = 'Carbon steel'
+        D1.simulate()
+        assert_allclose(cost, 2. * D1.purchase_costs['Rectifier trays'])
+    finally:
+        del tray_material_factor_functions['Dummy']
+
+if __name__ == '__main__':
+    test_distillation_reset_cache(bst.units.BinaryDistillation)
+    test_distillation_reset_cache(bst.units.ShortcutColumn)
+    test_distillation_auxiliary_thermo_chemical_order(bst.units.BinaryDistillation)
+    test_distillation_auxiliary_thermo_chemical_order(bst.units.ShortcutColumn)
+    test_compute_x_Rmin()
+    test_binary_distillation_minimum_reflux_near_azeotrope()
+    test_binary_distillation_minimum_reflux_multiple_intersections()
+    test_distillation_custom_tray_material()